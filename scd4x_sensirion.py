@@ -3,15 +3,84 @@
 from sensor_pack import bus_service
 from sensor_pack.base_sensor import BaseSensor, Iterator
 from sensor_pack import base_sensor
-from sensor_pack.crc_mod import crc8
 import micropython
+from micropython import const
+import ustruct
 import time
 
-
-def _calc_crc(sequence) -> int:
-    """Обертка для короткого вызова.
-    Wrapper for a short call."""
-    return crc8(sequence, polynomial=0x31, init_value=0xFF)
+# Коды команд SCD4x. Смотри '3 Digital interface description' в документации.
+# SCD4x command codes. Please see '3 Digital interface description' in the datasheet.
+_CMD_START_PERIODIC_MEAS = const(0x21B1)
+_CMD_START_LOW_POWER_PERIODIC_MEAS = const(0x21AC)
+_CMD_STOP_PERIODIC_MEAS = const(0x3F86)
+_CMD_READ_MEAS = const(0xEC05)
+_CMD_GET_DATA_READY_STATUS = const(0xE4B8)
+_CMD_SET_TEMPERATURE_OFFSET = const(0x241D)
+_CMD_GET_TEMPERATURE_OFFSET = const(0x2318)
+_CMD_SET_SENSOR_ALTITUDE = const(0x2427)
+_CMD_GET_SENSOR_ALTITUDE = const(0x2322)
+_CMD_SET_AMBIENT_PRESSURE = const(0xE000)
+_CMD_PERFORM_FORCED_RECALIBRATION = const(0x362F)
+_CMD_SET_AUTO_SELF_CALIBRATION = const(0x2416)
+_CMD_GET_AUTO_SELF_CALIBRATION = const(0x2313)
+_CMD_PERSIST_SETTINGS = const(0x3615)
+_CMD_GET_SERIAL_NUMBER = const(0x3682)
+_CMD_PERFORM_SELF_TEST = const(0x3639)
+_CMD_REINIT = const(0x3646)
+_CMD_MEASURE_SINGLE_SHOT = const(0x219D)
+_CMD_MEASURE_SINGLE_SHOT_RHT_ONLY = const(0x2196)
+_CMD_POWER_DOWN = const(0x36E0)
+_CMD_WAKE_UP = const(0x36F6)
+
+# Таблица CRC-8 (полином 0x31, x^8 + x^5 + x^4 + 1), заранее рассчитанная для всех 256 значений байта.
+# Смотри sensor_pack/crc_mod.py
+# CRC-8 table (polynomial 0x31, x^8 + x^5 + x^4 + 1), precomputed for all 256 byte values.
+# See sensor_pack/crc_mod.py
+_CRC8_TABLE = (
+    b"\x00\x31\x62\x53\xc4\xf5\xa6\x97\xb9\x88\xdb\xea\x7d\x4c\x1f\x2e"
+    b"\x43\x72\x21\x10\x87\xb6\xe5\xd4\xfa\xcb\x98\xa9\x3e\x0f\x5c\x6d"
+    b"\x86\xb7\xe4\xd5\x42\x73\x20\x11\x3f\x0e\x5d\x6c\xfb\xca\x99\xa8"
+    b"\xc5\xf4\xa7\x96\x01\x30\x63\x52\x7c\x4d\x1e\x2f\xb8\x89\xda\xeb"
+    b"\x3d\x0c\x5f\x6e\xf9\xc8\x9b\xaa\x84\xb5\xe6\xd7\x40\x71\x22\x13"
+    b"\x7e\x4f\x1c\x2d\xba\x8b\xd8\xe9\xc7\xf6\xa5\x94\x03\x32\x61\x50"
+    b"\xbb\x8a\xd9\xe8\x7f\x4e\x1d\x2c\x02\x33\x60\x51\xc6\xf7\xa4\x95"
+    b"\xf8\xc9\x9a\xab\x3c\x0d\x5e\x6f\x41\x70\x23\x12\x85\xb4\xe7\xd6"
+    b"\x7a\x4b\x18\x29\xbe\x8f\xdc\xed\xc3\xf2\xa1\x90\x07\x36\x65\x54"
+    b"\x39\x08\x5b\x6a\xfd\xcc\x9f\xae\x80\xb1\xe2\xd3\x44\x75\x26\x17"
+    b"\xfc\xcd\x9e\xaf\x38\x09\x5a\x6b\x45\x74\x27\x16\x81\xb0\xe3\xd2"
+    b"\xbf\x8e\xdd\xec\x7b\x4a\x19\x28\x06\x37\x64\x55\xc2\xf3\xa0\x91"
+    b"\x47\x76\x25\x14\x83\xb2\xe1\xd0\xfe\xcf\x9c\xad\x3a\x0b\x58\x69"
+    b"\x04\x35\x66\x57\xc0\xf1\xa2\x93\xbd\x8c\xdf\xee\x79\x48\x1b\x2a"
+    b"\xc1\xf0\xa3\x92\x05\x34\x67\x56\x78\x49\x1a\x2b\xbc\x8d\xde\xef"
+    b"\x82\xb3\xe0\xd1\x46\x77\x24\x15\x3b\x0a\x59\x68\xff\xce\x9d\xac"
+)
+
+
+@micropython.viper
+def _calc_crc(buf: ptr8, start: int) -> int:
+    """Табличный расчет CRC-8 (полином 0x31, начальное значение 0xFF) двухбайтного слова buf[start:start + 2].
+    Датчик всегда считает CRC по одному слову, поэтому срез буфера не создается.
+    Table-driven CRC-8 (polynomial 0x31, init value 0xFF) of the two byte word buf[start:start + 2].
+    The sensor always calculates CRC over a single word, so no buffer slice is created."""
+    t = ptr8(_CRC8_TABLE)
+    return t[t[0xFF ^ buf[start]] ^ buf[start + 1]]
+
+
+@micropython.native
+def _be16(buf, start: int) -> int:
+    """Возвращает беззнаковое двухбайтное слово big-endian из buf[start:start + 2].
+    Returns the unsigned big-endian two byte word from buf[start:start + 2]."""
+    return (buf[start] << 8) | buf[start + 1]
+
+
+@micropython.native
+def _check_crc(buf):
+    """Проверяет CRC каждой тройки байт (старший байт, младший байт, crc) в ответе датчика.
+    Checks the CRC of each (msb, lsb, crc) byte triplet in the sensor response."""
+    for i in range(0, len(buf), 3):
+        crc = _calc_crc(buf, i)
+        if crc != buf[i + 2]:
+            raise ValueError(f"Invalid CRC! Calculated {crc}. From buffer {buf[i + 2]}")
 
 
 class SCD4xSensirion(BaseSensor, Iterator):
@@ -28,6 +97,10 @@ class SCD4xSensirion(BaseSensor, Iterator):
         super().__init__(adapter, address, True)    # Big Endian
         self._buf_3 = bytearray((0 for _ in range(3)))
         self._buf_9 = bytearray((0 for _ in range(9)))
+        # буфер передачи: код команды (2 байта) + значение (2 байта) + его crc (1 байт)
+        # transmit buffer: command code (2 bytes) + value (2 bytes) + its crc (1 byte)
+        self._txbuf = bytearray(5)
+        self._txmv = memoryview(self._txbuf)
         self.check_crc = check_crc
         # power mode
         self._low_power_mode = False
@@ -35,8 +108,6 @@ class SCD4xSensirion(BaseSensor, Iterator):
         self._single_shot_mode = False
         self._rht_only = False
         self._isSCD41 = this_is_scd41
-        # сохраняю, чтобы не вызывать 125 раз
-        self.byte_order = self._get_byteorder_as_str()
 
     def _get_local_buf(self, bytes_for_read: int) -> [None, bytearray]:
         """возвращает локальный буфер для операции чтения"""
@@ -48,13 +119,6 @@ class SCD4xSensirion(BaseSensor, Iterator):
             return self._buf_3
         return self._buf_9
 
-    def _to_bytes(self, value, length: int):
-        byteorder = self.byte_order[0]
-        return value.to_bytes(length, byteorder)
-
-    # def _read(self, n_bytes: int) -> bytes:
-    #    return self.adapter.read(self.address, n_bytes)
-
     def _write(self, buf: bytes) -> bytes:
         return self.adapter.write(self.address, buf)
 
@@ -62,41 +126,48 @@ class SCD4xSensirion(BaseSensor, Iterator):
         """Читает из устройства в буфер"""
         return self.adapter.readfrom_into(self.address, buf)
 
-    def _send_command(self, cmd: int, value: [bytes, None],
-                      wait_time: int = 0, bytes_for_read: int = 0,
-                      crc_index: range = None,
-                      value_index: tuple = None) -> [bytes, None]:
+    def _send_command(self, cmd: int, value: [int, None],
+                      wait_time: int = 0, bytes_for_read: int = 0) -> [bytes, None]:
         """Передает команду датчику по шине.
         cmd - код команды.
-        value - последовательность, передаваемая после кода команды.
+        value - двухбайтное слово, передаваемое после кода команды, или None.
         wait_time - время в мс. которое нужно подождать для обработки команды датчиком.
         bytes_for_read - количество байт в ответе датчика, если не 0, то будет считан ответ,
         проверена CRC (зависит от self.check_crc) и этот ответ будет возвращен, как результат.
-        crc_index_range - индексы crc в последовательности.
-        value_index_ranges- кортеж индексов (range) данных значений в
-        последовательности. (range(3), range(4,6), range(7,9))"""
-        # print(f"DBG: bytes_for_read: {bytes_for_read}")
-        raw_cmd = self._to_bytes(cmd, 2)
-        raw_out = raw_cmd
-        if value:
-            raw_out += value    # добавляю value и его crc
-            raw_out += self._to_bytes(_calc_crc(value), 1)     # crc считается только для данных!
-        self._write(raw_out)    # выдача на шину
+        Ответ датчика всегда состоит из троек байт: (старший байт, младший байт, crc)."""
+        tx = self._txbuf
+        if value is not None:
+            base_sensor.check_value(value, range(0x10000), f"Invalid value for cmd {hex(cmd)}: {value}")
+            ustruct.pack_into(">HH", tx, 0, cmd, value)    # добавляю value и его crc
+            tx[4] = _calc_crc(tx, 2)     # crc считается только для данных!
+            self._write(self._txmv[:5])    # выдача на шину
+        else:
+            tx[0] = cmd >> 8
+            tx[1] = cmd & 0xFF
+            self._write(self._txmv[:2])
         if wait_time:
             time.sleep_ms(wait_time)   # ожидание
         if not bytes_for_read:
             return None
-        # b = self._read(bytes_for_read)  # читаю с шины с проверкой количества считанных байт
+        return self._read_response(bytes_for_read)    # возврат bytearray со считанными данными
+
+    def _query(self, cmd: int, wait_time: int, bytes_for_read: int) -> bytearray:
+        """Команда чтения без параметров.
+        Передает код команды, ждет wait_time мс. и считывает bytes_for_read (3 или 9) байт ответа,
+        проверяя CRC (зависит от self.check_crc).
+        Read command without parameters."""
+        self._send_command(cmd, None, wait_time)
+        return self._read_response(bytes_for_read)
+
+    def _read_response(self, bytes_for_read: int) -> bytearray:
+        """Считывает bytes_for_read (3 или 9) байт ответа датчика в локальный буфер и проверяет CRC
+        (зависит от self.check_crc).
+        Reads bytes_for_read (3 or 9) bytes of the sensor response into the local buffer and checks the CRC."""
         b = self._get_local_buf(bytes_for_read)
-        self._readfrom_into(b)      # обновление
-        base_sensor.check_value(len(b), (bytes_for_read,),
-                                f"Invalid buffer length for cmd: {cmd}. Received {len(b)} out of {bytes_for_read}")
+        self._readfrom_into(b)
         if self.check_crc:
-            crc_from_buf = [b[i] for i in crc_index]  # build list of CRC from buf
-            calculated_crc = [_calc_crc(b[rng.start:rng.stop]) for rng in value_index]
-            if crc_from_buf != calculated_crc:
-                raise ValueError(f"Invalid CRC! Calculated{calculated_crc}. From buffer {crc_from_buf}")
-        return b    # возврат bytearray со считанными данными
+            _check_crc(b)
+        return b
 
     # BaseSensor
     # Advanced features
@@ -112,7 +183,7 @@ class SCD4xSensirion(BaseSensor, Iterator):
         SCD4x, saving it when the power is turned off. To avoid unnecessary wear on the EEPROM, the method should only
         be called if necessary(!) and if actual configuration changes have been made.
         EEPROM is guaranteed to withstand at least 2000 write cycles to failure (!)"""
-        cmd = 0x3615
+        cmd = _CMD_PERSIST_SETTINGS
         self._send_command(cmd, None, 800)
 
     def get_id(self) -> tuple:
@@ -120,11 +191,10 @@ class SCD4xSensirion(BaseSensor, Iterator):
         the chip and to verify the presence of the sensor."""
         # создатели датчика 'обрадовали'. вместо подсчета одного байта CRC на 6 байт (3 двухбайтных слова)
         # они считают CRC для каждого из 3-х двухбайтных слов!
-        cmd = 0x3682
-        b = self._send_command(cmd, None, 0, bytes_for_read=9,
-                               crc_index=range(2, 9, 3), value_index=(range(2), range(3, 5), range(6, 8)))
-        # return result
-        return tuple([(b[i] << 8) | b[i+1] for i in range(0, 9, 3)])    # Success
+        cmd = _CMD_GET_SERIAL_NUMBER
+        b = self._query(cmd, 1, 9)     # время выполнения команды 1 мс. command execution time 1 ms
+        # три слова big-endian, байты crc пропускаются. three big-endian words, crc bytes are skipped
+        return ustruct.unpack(">HxHxHx", b)    # Success
 
     def soft_reset(self):
         """Я сознательно не стал использовать команду perfom_factory_reset, чтобы было невозможно испортить датчик
@@ -138,14 +208,32 @@ class SCD4xSensirion(BaseSensor, Iterator):
         """"Этот метод можно использовать в качестве конечного теста для проверки работоспособности датчика и
         проверки подачи питания на датчик. Возвращает Истина, когда тест пройден успешно.
         The feature can be used as an end-of-line test to check sensor functionality and the customer power
-        supply to the sensor. Returns True when the test is successful."""
-        cmd = 0x3639
+        supply to the sensor. Returns True when the test is successful.
+        Метод блокирует выполнение на 10 секунд! В программах на asyncio используйте exec_self_test_async.
+        The method blocks for 10 seconds! In asyncio programs use exec_self_test_async."""
+        cmd = _CMD_PERFORM_SELF_TEST
         length = 3
-        b = self._send_command(cmd, None, wait_time=10_000,     # да, ждать 10 секунд! yes, wait 10 seconds!
-                               bytes_for_read=length, crc_index=range(2, 3), value_index=(range(2),))
-        res = self.unpack("H", b)[0]
+        b = self._query(cmd, 10_000, length)     # да, ждать 10 секунд! yes, wait 10 seconds!
+        res = _be16(b, 0)
         return 0 == res
 
+    async def exec_self_test_async(self) -> bool:
+        """Асинхронный вариант exec_self_test. Пока датчик выполняет тест (10 секунд), управление передается
+        другим задачам цикла событий.
+        Внимание! До завершения этой сопрограммы нельзя вызывать никакие другие методы этого экземпляра
+        (например, is_data_ready из другой задачи): датчик не принимает команды, пока выполняет предыдущую,
+        а буферы передачи и приема экземпляра общие и ответ теста будет испорчен!
+        Asynchronous variant of exec_self_test. While the sensor runs the test (10 seconds), control is passed
+        to other tasks of the event loop.
+        Warning! No other method of this instance (e.g. is_data_ready from another task) may be called until this
+        coroutine completes: the sensor does not accept commands while a previous command is being processed, and
+        the transmit and receive buffers of the instance are shared, so the test result would be corrupted!"""
+        import asyncio  # импорт по требованию, чтобы не расходовать ОЗУ в синхронных программах
+        self._send_command(_CMD_PERFORM_SELF_TEST, None)
+        await asyncio.sleep_ms(10_000)      # да, ждать 10 секунд! yes, wait 10 seconds!
+        b = self._read_response(3)
+        return 0 == _be16(b, 0)
+
     def reinit(self) -> None:
         """Команда reinit повторно инициализирует датчик, загружая пользовательские настройки из EEPROM.
         Перед отправкой команды reinit необходимо выполнить метод stop_measurement. Если команда reinit не вызывает
@@ -154,7 +242,7 @@ class SCD4xSensirion(BaseSensor, Iterator):
         Before sending the reinit command, the stop_measurement method must be called.
         If the reinit command does not trigger the desired re-initialization,
         a power-cycle should be applied to the SCD4x."""
-        cmd = 0x3646
+        cmd = _CMD_REINIT
         self._send_command(cmd, None, 20)
 
     # On-chip output signal compensation
@@ -174,17 +262,19 @@ class SCD4xSensirion(BaseSensor, Iterator):
         The method should be called only in IDLE sensor mode!
 
         𝑇 𝑜𝑓𝑓𝑠𝑒𝑡_𝑎𝑐𝑡𝑢𝑎𝑙 = 𝑇 𝑆𝐶𝐷40 − 𝑇 𝑅𝑒𝑓𝑒𝑟𝑒𝑛𝑐𝑒 + 𝑇 𝑜𝑓𝑓𝑠𝑒𝑡_ 𝑝𝑟𝑒𝑣𝑖𝑜𝑢𝑠"""
-        cmd = 0x241D
-        offset_raw = self._to_bytes(int(374.49142857 * offset), 2)
+        cmd = _CMD_SET_TEMPERATURE_OFFSET
+        # offset_raw = offset * 2^16 / 175. Для целого offset вычисляется без чисел с плавающей точкой.
+        # For an integer offset it is calculated without floating point numbers.
+        offset_raw = int(offset * 65536) // 175
         self._send_command(cmd, offset_raw, 1)
 
     def get_temperature_offset(self) -> float:
         """Метод нужно вызывать только в IDLE режиме датчика!
         The method should be called only in IDLE sensor mode!"""
-        cmd = 0x2318
-        b = self._send_command(cmd, None, wait_time=1, bytes_for_read=3, crc_index=range(2, 3), value_index=(range(2),))
-        temp_offs = self.unpack("H", b)[0]
-        return 0.0026702880859375 * temp_offs
+        cmd = _CMD_GET_TEMPERATURE_OFFSET
+        b = self._query(cmd, 1, 3)
+        temp_offs = _be16(b, 0)
+        return 175 * temp_offs / 65536     # offset = offset_raw * 175 / 2^16
 
     def set_altitude(self, masl: int):  # вызов нужно делать только в IDLE режиме датчика!
         """Чтение и запись высоты датчика должны выполняться, когда SCD4x находится в режиме ожидания.
@@ -196,16 +286,15 @@ class SCD4xSensirion(BaseSensor, Iterator):
         the save_config method. By default, the sensor height is set to 0 meters above sea level (masl).
         Метод нужно вызывать только в IDLE режиме датчика!
         The method should be called only in IDLE sensor mode!"""
-        cmd = 0x2427
-        masl_raw = self._to_bytes(masl, 2)
-        self._send_command(cmd, masl_raw, 1)
+        cmd = _CMD_SET_SENSOR_ALTITUDE
+        self._send_command(cmd, masl, 1)
 
     def get_altitude(self) -> int:
         """Метод нужно вызывать только в IDLE режиме датчика!
         The method should be called only in IDLE sensor mode!"""
-        cmd = 0x2322
-        b = self._send_command(cmd, None, wait_time=1, bytes_for_read=3, crc_index=range(2, 3), value_index=(range(2),))
-        return self.unpack("H", b)[0]
+        cmd = _CMD_GET_SENSOR_ALTITUDE
+        b = self._query(cmd, 1, 3)
+        return _be16(b, 0)
 
     def set_ambient_pressure(self, pressure: float):
         """Метод может быть вызван во время периодических измерений, чтобы включить непрерывную компенсацию давления.
@@ -217,31 +306,28 @@ class SCD4xSensirion(BaseSensor, Iterator):
         Note that setting the ambient pressure using set_ambient_pressure overrides any pressure compensation based
         on the previously set sensor height. The use of this command is highly recommended for applications with
         significant changes in ambient pressure to ensure sensor accuracy."""
-        cmd = 0xE000
-        press_raw = self._to_bytes(int(pressure // 100), 2)     # Pascal // 100
-        self._send_command(cmd, press_raw, 1)
+        cmd = _CMD_SET_AMBIENT_PRESSURE
+        self._send_command(cmd, int(pressure // 100), 1)     # Pascal // 100
 
     # Field calibration
     def force_recalibration(self, target_co2_concentration: int) -> int:
         """Please read '3.7.1 perform_forced_recalibration'"""
         base_sensor.check_value(target_co2_concentration, range(2**16),
                                 f"Invalid target CO2 concentration: {target_co2_concentration} ppm")
-        cmd = 0x362F
-        target_raw = self._to_bytes(target_co2_concentration, 2)
-        b = self._send_command(cmd, target_raw, 400, 3, crc_index=range(2, 3), value_index=(range(2),))
+        cmd = _CMD_PERFORM_FORCED_RECALIBRATION
+        b = self._send_command(cmd, target_co2_concentration, 400, 3)
         return self.unpack("h", b)[0]
 
     def is_auto_calibration(self) -> bool:
         """Please read '3.7.3 get_automatic_self_calibration_enabled'"""
-        cmd = 0x2313
-        b = self._send_command(cmd, None, 1, 3, crc_index=range(2, 3), value_index=(range(2),))
-        return 0 != self.unpack("H", b)[0]
+        cmd = _CMD_GET_AUTO_SELF_CALIBRATION
+        b = self._query(cmd, 1, 3)
+        return 0 != _be16(b, 0)
 
     def set_auto_calibration(self, value: bool):
         """Please read '3.7.2 set_automatic_self_calibration_enabled'"""
-        cmd = 0x2416
-        value_raw = self._to_bytes(int(value), 2)
-        self._send_command(cmd, value_raw, 1, 0)
+        cmd = _CMD_SET_AUTO_SELF_CALIBRATION
+        self._send_command(cmd, int(value), 1, 0)
 
     def set_measurement(self, start: bool, single_shot: bool = False, rht_only: bool = False):
         """Используется для запуска или остановки периодических измерений.
@@ -267,9 +353,9 @@ class SCD4xSensirion(BaseSensor, Iterator):
         To read the results, use the get_meas_data method."""
         wt = 0
         if start:
-            cmd = 0x21AC if self._low_power_mode else 0x21B1
+            cmd = _CMD_START_LOW_POWER_PERIODIC_MEAS if self._low_power_mode else _CMD_START_PERIODIC_MEAS
         else:   # stop periodic measurement
-            cmd = 0x3F86
+            cmd = _CMD_STOP_PERIODIC_MEAS
             wt = 500
         self._send_command(cmd, None, wt)
         self._single_shot_mode = False
@@ -280,19 +366,18 @@ class SCD4xSensirion(BaseSensor, Iterator):
         обновления сигнала, так как буфер очищается при считывании. Смотри get_conversion_cycle_time()!
         Read sensor data output. The measurement data can only be read out once per signal update interval
         as the buffer is emptied upon read-out. See get_conversion_cycle_time()!"""
-        cmd = 0xEC05
-        val_index = (range(2), range(3, 5), range(6, 8))
-        b = self._send_command(cmd, None, 1, bytes_for_read=9,
-                               crc_index=range(2, 9, 3), value_index=val_index)
-        words = [self.unpack("H", b[val_rng.start:val_rng.stop])[0] for val_rng in val_index]
+        cmd = _CMD_READ_MEAS
+        b = self._query(cmd, 1, 9)
         #       CO2 [ppm]           T, Celsius              Relative Humidity, %
-        return words[0], -45 + 0.0026703288 * words[1], 0.0015259022 * words[2]
+        return _be16(b, 0), -45 + 0.0026703288 * _be16(b, 3), 0.0015259022 * _be16(b, 6)
 
     def is_data_ready(self) -> bool:
         """Return data ready status"""
-        cmd = 0xE4B8
-        b = self._send_command(cmd, None, 1, 3, crc_index=range(2, 3), value_index=(range(2),))
-        return bool(self.unpack("H", b)[0] & 0b0000_0111_1111_1111)
+        cmd = _CMD_GET_DATA_READY_STATUS
+        b = self._query(cmd, 1, 3)
+        # младшие 11 бит слова: 3 бита старшего байта и весь младший байт.
+        # low 11 bits of the word: 3 bits of the msb and the whole lsb.
+        return 0 != ((b[0] & 0b0000_0111) | b[1])
 
     @micropython.native
     def get_conversion_cycle_time(self) -> int:
@@ -307,7 +392,7 @@ class SCD4xSensirion(BaseSensor, Iterator):
         if not self._isSCD41:
             return
         """Please read '3.10.3 power_down' and '3.10.4 wake_up'"""
-        cmd = 0x36F6 if value else 0x36E0
+        cmd = _CMD_WAKE_UP if value else _CMD_POWER_DOWN
         wt = 20 if value else 1
         self._send_command(cmd, None, wt)
 
@@ -322,7 +407,7 @@ class SCD4xSensirion(BaseSensor, Iterator):
         Please see '3.10 Low power single shot (SCD41)'"""
         if not self._isSCD41:
             return
-        cmd = 0x2196 if rht_only else 0x219D
+        cmd = _CMD_MEASURE_SINGLE_SHOT_RHT_ONLY if rht_only else _CMD_MEASURE_SINGLE_SHOT
         self._send_command(cmd, None, 0)
         self._single_shot_mode = True
         self._rht_only = rht_only
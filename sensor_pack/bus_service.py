@@ -107,8 +107,6 @@ class I2cAdapter(BusAdapter):
         return self.bus.readfrom_mem_into(device_addr, mem_addr, buf)
 
     def write(self, device_addr: int, buf: bytes):
-        hexified = ' '.join(hex(b) for b in buf)
-        # print(f'Going to write {hexified} to device address {hex(device_addr)}')
         return self.bus.writeto(device_addr, buf)
 
     def write_buf_to_mem(self, device_addr: int, mem_addr, buf):